@@ -1,6 +1,7 @@
 # app/domain/ports/operation_repository.py
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
+from datetime import date
 
 from app.domain.models.invoice import Invoice
 from app.infrastructure.persistence.models import Operacion
@@ -29,4 +30,31 @@ class OperationRepository(ABC):
         Genera un ID de operación único y secuencial con el formato OP-YYYYMMDD-XXX.
         El contador XXX se reinicia cada día.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def rebuild_rollups(self, desde: Optional[date] = None) -> int:
+        """
+        Recalcula el resumen diario de operaciones desde los datos históricos.
+        Retorna la cantidad de filas de resumen generadas.
+        """
+        pass
+
+    @abstractmethod
+    def recompute_operation_totals(self, desde: Optional[date] = None) -> int:
+        """
+        Recalcula `monto_sumatoria_total` de las operaciones existentes usando
+        solo las facturas en `moneda_sumatoria`. Retorna las operaciones actualizadas.
+        """
+        pass
+
+    @abstractmethod
+    def get_rollup_summary(self, group_by: List[str], filters: Dict[str, Any], desde: Optional[date] = None, hasta: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Retorna los totales y conteos del resumen diario agrupados por las
+        dimensiones indicadas (fecha, cliente_ruc, deudor_ruc, moneda, nombre_ejecutivo).
+        Los montos nunca mezclan monedas: si `moneda` no está agrupada ni
+        filtrada, se agrega a la agrupación. Lanza ValueError ante dimensiones
+        desconocidas.
+        """
+        pass
@@ -0,0 +1,39 @@
+# app/infrastructure/api/routers/dashboard_router.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+
+from app.infrastructure.persistence.database import get_db
+from app.infrastructure.persistence.operation_repository_adapter import PostgreSQLOperationRepository, rollup_grouping
+
+router = APIRouter(prefix="/api/v1/dashboard", tags=["Dashboard"])
+
+@router.get("/resumen", summary="Totales de operaciones desde el resumen diario")
+def get_summary(
+    agrupar_por: List[str] = Query(["fecha", "moneda"], description="Dimensiones: fecha, cliente_ruc, deudor_ruc, moneda, nombre_ejecutivo."),
+    desde: Optional[date] = Query(None, description="Fecha inicial (inclusive)."),
+    hasta: Optional[date] = Query(None, description="Fecha final (inclusive)."),
+    cliente_ruc: Optional[str] = None,
+    deudor_ruc: Optional[str] = None,
+    moneda: Optional[str] = None,
+    nombre_ejecutivo: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Devuelve montos y conteos agregados leyendo únicamente la tabla de resumen.
+    Los montos nunca mezclan monedas: si `moneda` no está en `agrupar_por`
+    ni en los filtros, se agrega automáticamente a la agrupación.
+    """
+    filters = {
+        "cliente_ruc": cliente_ruc, "deudor_ruc": deudor_ruc,
+        "moneda": moneda, "nombre_ejecutivo": nombre_ejecutivo
+    }
+    filters = {dim: valor for dim, valor in filters.items() if valor is not None}
+
+    try:
+        group_by = rollup_grouping(agrupar_por, filters)
+        rows = PostgreSQLOperationRepository(db).get_rollup_summary(group_by, filters, desde=desde, hasta=hasta)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"agrupar_por": group_by, "resultados": rows}
@@ -16,4 +16,12 @@ if not DATABASE_URL:
 engine = create_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+def get_db():
+    """Dependencia de FastAPI que entrega una sesión y la cierra al terminar."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
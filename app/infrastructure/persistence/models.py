@@ -1,5 +1,5 @@
 # app/infrastructure/persistence/models.py
-from sqlalchemy import Column, String, Float, ForeignKey, Integer, DateTime, Text
+from sqlalchemy import Column, String, Float, ForeignKey, Integer, DateTime, Date, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
@@ -37,4 +37,46 @@ class Factura(Base):
     
     # Relaciones actualizadas
     operacion = relationship("Operacion", back_populates="facturas")
-    deudor = relationship("Empresa")
\ No newline at end of file
+    deudor = relationship("Empresa")
+
+class ResumenOperacionDiaria(Base):
+    """
+    Tabla de agregados para los dashboards. Cada fila acumula los montos y
+    conteos de un día x cliente x deudor x moneda x ejecutivo. Se actualiza
+    en la misma transacción que `save_full_operation` y puede reconstruirse
+    desde cero con `python -m app.infrastructure.persistence.rebuild_rollups`.
+    """
+    __tablename__ = "resumen_operaciones_diario"
+    fecha = Column(Date, primary_key=True)
+    cliente_ruc = Column(String(15), primary_key=True)
+    deudor_ruc = Column(String(15), primary_key=True)
+    moneda = Column(String(10), primary_key=True)
+    nombre_ejecutivo = Column(Text, primary_key=True)
+    monto_total = Column(Float, nullable=False, server_default='0')
+    monto_neto = Column(Float, nullable=False, server_default='0')
+    cantidad_facturas = Column(Integer, nullable=False, server_default='0')
+    # Solo se puede sumar entre filas con el mismo deudor y moneda: una
+    # operación con varios deudores cuenta en cada una de sus celdas.
+    cantidad_operaciones = Column(Integer, nullable=False, server_default='0')
+
+class ResumenOperacionClienteDiaria(Base):
+    """
+    Mismo resumen sin la dimensión deudor (día x cliente x moneda x ejecutivo).
+    Cada operación suma 1 a una sola fila por moneda, así que sus conteos de
+    operaciones se pueden sumar por fecha, cliente y ejecutivo.
+    """
+    __tablename__ = "resumen_operaciones_cliente_diario"
+    fecha = Column(Date, primary_key=True)
+    cliente_ruc = Column(String(15), primary_key=True)
+    moneda = Column(String(10), primary_key=True)
+    nombre_ejecutivo = Column(Text, primary_key=True)
+    monto_total = Column(Float, nullable=False, server_default='0')
+    monto_neto = Column(Float, nullable=False, server_default='0')
+    cantidad_facturas = Column(Integer, nullable=False, server_default='0')
+    cantidad_operaciones = Column(Integer, nullable=False, server_default='0')
+
+ROLLUP_TABLES = [ResumenOperacionDiaria.__table__, ResumenOperacionClienteDiaria.__table__]
+
+def create_rollup_tables(bind) -> None:
+    """Crea las tablas de resumen si todavía no existen."""
+    Base.metadata.create_all(bind=bind, tables=ROLLUP_TABLES, checkfirst=True)
@@ -1,10 +1,36 @@
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
-from sqlalchemy import func, text
+from sqlalchemy import func, text, cast, Date, distinct, select, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.domain.ports.operation_repository import OperationRepository
 from app.domain.models.invoice import Invoice
-from .models import Operacion, Factura, Empresa
-from datetime import datetime
+from .models import Operacion, Factura, Empresa, ResumenOperacionDiaria, ResumenOperacionClienteDiaria
+from datetime import datetime, date
+
+# Dimensiones por las que se puede agrupar el resumen de los dashboards
+ROLLUP_DIMENSIONS = ("fecha", "cliente_ruc", "deudor_ruc", "moneda", "nombre_ejecutivo")
+ROLLUP_CLIENT_DIMENSIONS = ("fecha", "cliente_ruc", "moneda", "nombre_ejecutivo")
+ROLLUP_METRICS = ("monto_total", "monto_neto", "cantidad_facturas", "cantidad_operaciones")
+
+# El día de una operación se calcula siempre en SQL y en una zona horaria fija,
+# para que el upsert incremental y la reconstrucción no dependan de la zona de
+# la sesión (PGTZ) ni del reloj del worker.
+ROLLUP_TIMEZONE = "America/Lima"
+FECHA_RESUMEN = cast(func.timezone(ROLLUP_TIMEZONE, Operacion.fecha_creacion), Date)
+
+def rollup_grouping(group_by: List[str], filters: Dict[str, Any]) -> List[str]:
+    """
+    Valida las dimensiones de una consulta al resumen y retorna la agrupación
+    efectiva. Los montos nunca mezclan monedas: si `moneda` no está agrupada
+    ni filtrada, se agrega a la agrupación.
+    """
+    invalidas = [dim for dim in list(group_by) + list(filters) if dim not in ROLLUP_DIMENSIONS]
+    if invalidas:
+        raise ValueError(f"Dimensiones no válidas: {', '.join(invalidas)}")
+    grouping = list(dict.fromkeys(group_by))
+    if "moneda" not in grouping and "moneda" not in filters:
+        grouping.append("moneda")
+    return grouping
 
 class PostgreSQLOperationRepository(OperationRepository):
     def __init__(self, db: Session):
@@ -42,8 +68,10 @@ class PostgreSQLOperationRepository(OperationRepository):
             raise ValueError("No se puede guardar una operación sin facturas.")
         
         primer_cliente = self._find_or_create_company(invoices[0].client_ruc, invoices[0].client_name)
-        monto_sumatoria = sum(inv.total_amount for inv in invoices)
         moneda_sumatoria = invoices[0].currency
+        # Solo se suman las facturas en la moneda de la operación; el desglose
+        # completo por moneda queda en la tabla de resumen.
+        monto_sumatoria = sum(inv.total_amount for inv in invoices if inv.currency == moneda_sumatoria)
 
         # 3. Crear la operación principal
         email = metadata.get('user_email', 'unknown@example.com')
@@ -76,9 +104,127 @@ class PostgreSQLOperationRepository(OperationRepository):
                 id_proceso_cavali=cavali_data.get("process_id"),
             )
             self.db.add(db_factura)
-            
+
+        # 5. Actualizar el resumen diario dentro de la misma transacción
+        self.db.flush()
+        self._update_rollups(operation_id)
+
         return operation_id
 
+    def _update_rollups(self, operation_id: str) -> None:
+        """
+        Suma los totales de una operación recién guardada a los resúmenes
+        (upsert). Usa las mismas expresiones que `rebuild_rollups`.
+        """
+        op_filter = Operacion.id == operation_id
+        self._upsert_rollup(ResumenOperacionDiaria, self._rollup_select(ResumenOperacionDiaria, op_filter))
+        self._upsert_rollup(ResumenOperacionClienteDiaria, self._rollup_select(ResumenOperacionClienteDiaria, op_filter))
+
+    def _rollup_select(self, model, *conditions):
+        """Agrega `facturas` al grano de la tabla de resumen indicada."""
+        expresiones = {
+            "fecha": FECHA_RESUMEN,
+            "cliente_ruc": Operacion.cliente_ruc,
+            "deudor_ruc": func.coalesce(Factura.deudor_ruc, ''),
+            "moneda": func.coalesce(Factura.moneda, ''),
+            "nombre_ejecutivo": func.coalesce(Operacion.nombre_ejecutivo, ''),
+        }
+        dimensiones = [expresiones[dim] for dim in self._dimensions_of(model)]
+        return select(
+            *dimensiones,
+            func.coalesce(func.sum(Factura.monto_total), 0),
+            func.coalesce(func.sum(Factura.monto_neto), 0),
+            func.count(Factura.id),
+            func.count(distinct(Operacion.id)),
+        ).select_from(Factura).join(Operacion, Factura.id_operacion == Operacion.id)\
+            .where(*conditions).group_by(*dimensiones)
+
+    @staticmethod
+    def _dimensions_of(model) -> tuple:
+        return ROLLUP_DIMENSIONS if model is ResumenOperacionDiaria else ROLLUP_CLIENT_DIMENSIONS
+
+    def _upsert_rollup(self, model, agregados) -> None:
+        tabla = model.__table__
+        stmt = pg_insert(tabla).from_select(list(self._dimensions_of(model)) + list(ROLLUP_METRICS), agregados)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tabla.c[dim] for dim in self._dimensions_of(model)],
+            set_={metric: tabla.c[metric] + stmt.excluded[metric] for metric in ROLLUP_METRICS}
+        )
+        self.db.execute(stmt)
+
+    def rebuild_rollups(self, desde: Optional[date] = None) -> int:
+        """
+        Reconstruye los resúmenes diarios a partir de `operaciones` y `facturas`.
+        Si se indica `desde`, solo se recalculan los días a partir de esa fecha.
+        """
+        # Bloquea los upserts de los workers hasta el commit; los que ya estaban
+        # en curso terminan antes de que se lean los datos.
+        self.db.execute(text(
+            "LOCK TABLE resumen_operaciones_diario, resumen_operaciones_cliente_diario "
+            "IN SHARE ROW EXCLUSIVE MODE"
+        ))
+
+        condiciones = [FECHA_RESUMEN >= desde] if desde else []
+
+        filas = 0
+        for model in (ResumenOperacionDiaria, ResumenOperacionClienteDiaria):
+            borrado = self.db.query(model)
+            if desde:
+                borrado = borrado.filter(model.fecha >= desde)
+            borrado.delete(synchronize_session=False)
+
+            result = self.db.execute(
+                insert(model).from_select(
+                    list(self._dimensions_of(model)) + list(ROLLUP_METRICS),
+                    self._rollup_select(model, *condiciones)
+                )
+            )
+            filas += result.rowcount
+        return filas
+
+    def recompute_operation_totals(self, desde: Optional[date] = None) -> int:
+        """
+        Migración de datos: recalcula `monto_sumatoria_total` sumando solo las
+        facturas en `moneda_sumatoria`, como hace hoy `save_full_operation`.
+        """
+        subtotal = select(func.coalesce(func.sum(Factura.monto_total), 0))\
+            .where(Factura.id_operacion == Operacion.id, Factura.moneda == Operacion.moneda_sumatoria)\
+            .scalar_subquery()
+        condiciones = [FECHA_RESUMEN >= desde] if desde else []
+        result = self.db.execute(
+            update(Operacion)
+            .where(Operacion.moneda_sumatoria.isnot(None), *condiciones)
+            .values(monto_sumatoria_total=subtotal)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def get_rollup_summary(self, group_by: List[str], filters: Dict[str, Any], desde: Optional[date] = None, hasta: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Agrega los resúmenes diarios por las dimensiones de `group_by` (más
+        `moneda`, ver `rollup_grouping`). Nunca lee `operaciones` ni `facturas`,
+        por lo que el costo no depende del historial. Sin deudor se lee
+        `resumen_operaciones_cliente_diario` para no duplicar operaciones.
+        """
+        group_by = rollup_grouping(group_by, filters)
+        dimensiones = set(group_by) | set(filters)
+        model = ResumenOperacionDiaria if "deudor_ruc" in dimensiones else ResumenOperacionClienteDiaria
+
+        columnas = [getattr(model, dim) for dim in group_by]
+        query = self.db.query(
+            *columnas,
+            *[func.sum(getattr(model, metric)).label(metric) for metric in ROLLUP_METRICS]
+        )
+        if desde:
+            query = query.filter(model.fecha >= desde)
+        if hasta:
+            query = query.filter(model.fecha <= hasta)
+        for dim, valor in filters.items():
+            query = query.filter(getattr(model, dim) == valor)
+        query = query.group_by(*columnas).order_by(*columnas)
+
+        return [dict(row._mapping) for row in query.all()]
+
     def generar_siguiente_id_operacion(self) -> str:
         """
         Implementación que genera el ID de operación único y secuencial.
@@ -0,0 +1,53 @@
+# app/infrastructure/persistence/rebuild_rollups.py
+"""
+Crea (si faltan) y reconstruye las tablas de resumen diario a partir del
+historial. Debe ejecutarse una vez al desplegar, antes de arrancar los workers:
+`save_full_operation` actualiza estas tablas y falla si no existen.
+
+Con `--recalcular-sumatorias` también corrige, una sola vez, los
+`operaciones.monto_sumatoria_total` guardados antes de dejar de mezclar monedas.
+
+Uso:
+    python -m app.infrastructure.persistence.rebuild_rollups
+    python -m app.infrastructure.persistence.rebuild_rollups --desde 2025-01-01
+    python -m app.infrastructure.persistence.rebuild_rollups --recalcular-sumatorias
+"""
+import argparse
+import logging
+from datetime import date
+
+from .database import SessionLocal, engine
+from .models import create_rollup_tables
+from .operation_repository_adapter import PostgreSQLOperationRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconstruye el resumen diario de operaciones.")
+    parser.add_argument("--desde", type=date.fromisoformat, default=None,
+                        help="Recalcula solo desde esta fecha (YYYY-MM-DD). Por defecto, todo el historial.")
+    parser.add_argument("--recalcular-sumatorias", action="store_true",
+                        help="Recalcula también operaciones.monto_sumatoria_total (migración de datos).")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    create_rollup_tables(engine)
+
+    db_session = SessionLocal()
+    try:
+        repo = PostgreSQLOperationRepository(db_session)
+        if args.recalcular_sumatorias:
+            operaciones = repo.recompute_operation_totals(desde=args.desde)
+            logging.info(f"Sumatorias recalculadas en {operaciones} operaciones.")
+        filas = repo.rebuild_rollups(desde=args.desde)
+        db_session.commit()
+        logging.info(f"Resumen reconstruido: {filas} filas generadas.")
+    except Exception:
+        logging.error("Error al reconstruir el resumen. Iniciando rollback.", exc_info=True)
+        db_session.rollback()
+        raise
+    finally:
+        db_session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Importamos los routers de la capa de infraestructura
-from app.infrastructure.api.routers import operations_router
+from app.infrastructure.api.routers import operations_router, dashboard_router
 
 app = FastAPI(
     title="API de Procesamiento de Operaciones de Factoring",
@@ -26,6 +26,7 @@ app.add_middleware(
 )
 
 app.include_router(operations_router.router)
+app.include_router(dashboard_router.router)
 
 
 @app.get("/", tags=["Health Check"])
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+
+# database.py exige DATABASE_URL al importarse; create_engine no se conecta
+# hasta la primera consulta, así que las pruebas sin PostgreSQL no la usan.
+os.environ.setdefault("DATABASE_URL", os.getenv("TEST_DATABASE_URL") or "postgresql://localhost/test")
@@ -0,0 +1,53 @@
+# tests/test_dashboard_router.py
+"""
+Pruebas del endpoint de resumen sin base de datos: el repositorio se reemplaza
+por un stub que registra los argumentos recibidos.
+"""
+import pytest
+from fastapi import HTTPException
+
+from app.infrastructure.api.routers import dashboard_router
+
+
+class StubRepository:
+    calls = []
+
+    def __init__(self, db):
+        self.db = db
+
+    def get_rollup_summary(self, group_by, filters, desde=None, hasta=None):
+        StubRepository.calls.append({"group_by": group_by, "filters": filters, "desde": desde, "hasta": hasta})
+        return [{"moneda": "PEN", "monto_total": 10.0}]
+
+
+@pytest.fixture(autouse=True)
+def stub_repository(monkeypatch):
+    StubRepository.calls = []
+    monkeypatch.setattr(dashboard_router, "PostgreSQLOperationRepository", StubRepository)
+
+
+def _get_summary(agrupar_por, **filters):
+    params = dict(desde=None, hasta=None, cliente_ruc=None, deudor_ruc=None, moneda=None, nombre_ejecutivo=None)
+    params.update(filters)
+    return dashboard_router.get_summary(agrupar_por=agrupar_por, db=None, **params)
+
+
+def test_adds_moneda_to_grouping():
+    response = _get_summary(["cliente_ruc", "cliente_ruc"])
+    assert response["agrupar_por"] == ["cliente_ruc", "moneda"]
+    assert StubRepository.calls[0]["group_by"] == ["cliente_ruc", "moneda"]
+    assert response["resultados"] == [{"moneda": "PEN", "monto_total": 10.0}]
+
+
+def test_moneda_filter_keeps_grouping():
+    response = _get_summary(["nombre_ejecutivo"], moneda="USD")
+    assert response["agrupar_por"] == ["nombre_ejecutivo"]
+    assert StubRepository.calls[0]["filters"] == {"moneda": "USD"}
+
+
+def test_invalid_dimension_returns_400():
+    with pytest.raises(HTTPException) as exc:
+        _get_summary(["fecha", "sucursal"])
+    assert exc.value.status_code == 400
+    assert "sucursal" in exc.value.detail
+    assert StubRepository.calls == []
@@ -0,0 +1,141 @@
+# tests/test_rollups.py
+"""
+Verifica contra PostgreSQL que el upsert incremental de `save_full_operation`
+y `rebuild_rollups` producen exactamente las mismas filas de resumen.
+
+Requiere una base de pruebas: TEST_DATABASE_URL=postgresql://... python -m pytest tests
+"""
+import os
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL no definido")
+
+CLIENTE_RUC = "20999999991"
+
+
+@pytest.fixture
+def repo():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from app.infrastructure.persistence.database import Base
+    from app.infrastructure.persistence.operation_repository_adapter import PostgreSQLOperationRepository
+
+    engine = create_engine(TEST_DATABASE_URL)
+    Base.metadata.create_all(engine)
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    try:
+        yield PostgreSQLOperationRepository(session)
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+def _invoice(document_id, debtor_ruc, currency, total):
+    from app.domain.models.invoice import Invoice
+    return Invoice(
+        document_id=document_id, currency=currency,
+        total_amount=total, net_amount=total / 2,
+        debtor_name=f"Deudor {debtor_ruc}", debtor_ruc=debtor_ruc,
+        client_name="Cliente de prueba", client_ruc=CLIENTE_RUC
+    )
+
+
+def _snapshot(repo):
+    from app.infrastructure.persistence.models import ResumenOperacionDiaria, ResumenOperacionClienteDiaria
+    snapshot = {}
+    for model in (ResumenOperacionDiaria, ResumenOperacionClienteDiaria):
+        rows = repo.db.query(model).filter(model.cliente_ruc == CLIENTE_RUC).all()
+        columnas = [c.name for c in model.__table__.columns]
+        snapshot[model.__tablename__] = sorted(tuple(getattr(r, c) for c in columnas) for r in rows)
+    return snapshot
+
+
+def test_incremental_rollups_match_rebuild(repo):
+    metadata = {"user_email": "ana.perez@capitalexpress.cl"}
+    op1 = repo.save_full_operation(metadata, "https://drive/op1", [
+        _invoice("F001-1", "20111111111", "PEN", 100.0),
+        _invoice("F001-2", "20222222222", "PEN", 50.0),
+        _invoice("F001-3", "20222222222", "USD", 30.0),
+    ], {})
+    repo.save_full_operation(metadata, "https://drive/op2", [
+        _invoice("F001-4", "20111111111", "PEN", 20.0),
+        _invoice("F001-5", "20333333333", "USD", 10.0),
+    ], {})
+
+    incremental = _snapshot(repo)
+    assert incremental["resumen_operaciones_diario"]
+    repo.rebuild_rollups()
+    assert _snapshot(repo) == incremental
+
+    # La sumatoria de la operación no mezcla monedas
+    assert repo.find_by_id(op1).monto_sumatoria_total == 150.0
+
+    # Sin deudor, cada operación cuenta una sola vez por moneda
+    resumen = repo.get_rollup_summary(["moneda"], {"cliente_ruc": CLIENTE_RUC})
+    por_moneda = {row["moneda"]: row for row in resumen}
+    assert por_moneda["PEN"]["cantidad_operaciones"] == 2
+    assert por_moneda["PEN"]["monto_total"] == 170.0
+    assert por_moneda["USD"]["cantidad_operaciones"] == 2
+    assert por_moneda["USD"]["cantidad_facturas"] == 2
+
+    # Sin moneda en la consulta, el repositorio agrupa por moneda igualmente
+    por_cliente = repo.get_rollup_summary(["cliente_ruc"], {})
+    por_cliente = [row for row in por_cliente if row["cliente_ruc"] == CLIENTE_RUC]
+    assert {row["moneda"]: row["monto_total"] for row in por_cliente} == {"PEN": 170.0, "USD": 40.0}
+
+
+def _save_mixed_operation(repo):
+    return repo.save_full_operation({"user_email": "ana.perez@capitalexpress.cl"}, "https://drive/op", [
+        _invoice("F002-1", "20111111111", "PEN", 100.0),
+        _invoice("F002-2", "20222222222", "USD", 30.0),
+    ], {})
+
+
+def test_partial_rebuild_keeps_days_before_cutoff(repo):
+    from datetime import timedelta
+    from app.infrastructure.persistence.models import Operacion, ResumenOperacionDiaria
+    from app.infrastructure.persistence.operation_repository_adapter import FECHA_RESUMEN
+
+    operation_id = _save_mixed_operation(repo)
+    hoy = repo.db.query(FECHA_RESUMEN).filter(Operacion.id == operation_id).scalar()
+    incremental = _snapshot(repo)
+
+    # Fila de un día anterior sin facturas detrás: una reconstrucción total la
+    # borraría, una parcial desde hoy debe conservarla tal cual.
+    anterior = ResumenOperacionDiaria(
+        fecha=hoy - timedelta(days=1), cliente_ruc=CLIENTE_RUC, deudor_ruc="20111111111",
+        moneda="PEN", nombre_ejecutivo="Ana Perez", monto_total=999.0, monto_neto=999.0,
+        cantidad_facturas=9, cantidad_operaciones=9
+    )
+    repo.db.add(anterior)
+    # Una fila de hoy corrupta debe corregirse
+    repo.db.query(ResumenOperacionDiaria)\
+        .filter(ResumenOperacionDiaria.cliente_ruc == CLIENTE_RUC, ResumenOperacionDiaria.fecha == hoy)\
+        .update({"monto_total": 0.0}, synchronize_session=False)
+    repo.db.flush()
+
+    repo.rebuild_rollups(desde=hoy)
+    repo.db.expire_all()
+
+    despues = _snapshot(repo)["resumen_operaciones_diario"]
+    assert [row for row in despues if row[0] == hoy] == incremental["resumen_operaciones_diario"]
+    previas = [row for row in despues if row[0] < hoy]
+    assert len(previas) == 1 and previas[0][5] == 999.0
+
+
+def test_recompute_operation_totals_drops_other_currencies(repo):
+    from app.infrastructure.persistence.models import Operacion
+
+    operation_id = _save_mixed_operation(repo)
+    # Valor mezclado como el que guardaba la versión anterior
+    repo.db.query(Operacion).filter(Operacion.id == operation_id)\
+        .update({"monto_sumatoria_total": 130.0}, synchronize_session=False)
+
+    repo.recompute_operation_totals()
+    repo.db.expire_all()
+    assert repo.find_by_id(operation_id).monto_sumatoria_total == 100.0